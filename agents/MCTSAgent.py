@@ -86,7 +86,7 @@ class MCTSAgent(Player):
         implemented by subclasses, specifying the simulation policy and additional arguments or keyword arguments as needed. 
         The simulation step provides an estimate of the value for the expanded node based on the outcome of the playout.
         """
-        raise NotImplemented
+        raise NotImplementedError
     def backpropagation_(self, *args, **kwargs) -> Any:
         """
         Performs the backpropagation step of the MCTS algorithm by updating the value estimates for each visited node, 
@@ -95,5 +95,5 @@ class MCTSAgent(Player):
         additional arguments or keyword arguments as needed. 
         Backpropagation enables the agent to learn from the simulation results and refine its decision-making process.
         """
-        raise NotImplemented
+        raise NotImplementedError
     
\ No newline at end of file
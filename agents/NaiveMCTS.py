@@ -7,10 +7,31 @@ from agents.NaiveNode import NaiveNode
 from games.Game import Game
 from agents.MCTSAgent import MCTSAgent
 from games.Player import Player
-from collections import deque
+from games.tictactoe.TicTacToe import TicTacToeBoard
+from games.tictactoe.fast_rollout import rollout, rollout_from_bitboards, pack_board, to_indicator
+from policies.RandomPolicy import RandomTTTPolicy
+from concurrent.futures import ProcessPoolExecutor
 from policies.Policy import Policy
 from utils import Outcome
-import random 
+import random
+import threading
+
+def root_parallel_search_(worker_args):
+    """
+    Worker routine for root-parallel MCTS. Builds an independent tree with its own
+    seed, runs its share of iterations, and hands back just the root-child statistics.
+    Must live at module level so it can be pickled into the worker processes.
+    """
+    (game_obj, mark, opponent_mark, playout_policy, exploration_constant, seed, n_iters) = worker_args
+    random.seed(seed)
+    worker_agent = NaiveMCTS(game_obj, mark, opponent_mark, playout_policy, exploration_constant=exploration_constant)
+    for _ in range(n_iters):
+        worker_agent.step()
+    return {
+        tuple(action): (child.n_won, child.n_visited)
+        for action, child in zip(worker_agent.root.child_actions,
+                                 worker_agent.root.children_states)
+    }
 
 class NaiveMCTS(MCTSAgent):
     """
@@ -30,7 +51,7 @@ class NaiveMCTS(MCTSAgent):
     `make_move()`: Chooses the optimal move according to the current game tree exploration.
     Auxiliary methods for printing the game tree and converting it to a string representation are also provided. 
     """
-    def __init__(self, game: Game, mark, opponent_mark, playout_policy: Policy, exploration_constant=1):
+    def __init__(self, game: Game, mark, opponent_mark, playout_policy: Policy, exploration_constant=1, n_playouts=1):
         """
         Initializes the Naive MCTS algorithm with a game for it to play.
 
@@ -39,57 +60,124 @@ class NaiveMCTS(MCTSAgent):
         mark (int): The int representation of the mark the MCTS agent can use to make moves.
         opponent_mark (int): The int representation of the mark the opponent can use to make moves.
         playout_policy: (Policy): The policy that the MCTS agent will follow when at a new state.
+        n_playouts (int): How many playouts to run per step() from the chosen playout node.
+                          Amortizes selection/expansion overhead and lowers per-update variance.
         """
         saved_args = locals()
         del saved_args['self']
         del saved_args['__class__']
-        super().__init__(**saved_args) 
+        self.n_playouts = saved_args.pop('n_playouts')
+        super().__init__(**saved_args)
         self.root = NaiveNode(self.init_state)
         self.mark = mark
-        self.path: deque[NaiveNode] = deque([])
+        self.path: list[NaiveNode] = []
+        # Merged root-child statistics from the most recent step_parallel() call.
+        self.merged_child_stats = None
+        # Per-agent generator so rollouts don't contend on the module-level RNG.
+        self.rng = random.Random()
+        # Root used on the previous step(), kept around so its subtree can be
+        # grafted as the new root once the game advances.
+        self.last_root = None
+        # Free list of recycled game objects for playouts, so the generic rollout
+        # path reuses boards instead of allocating one per rollout.
+        self.game_pool: list[Game] = []
+        # Memoized legal-action lists keyed by the raw board bytes. Expansion asks
+        # for the same state's actions over and over within one deliberation, so
+        # after the first call the generator (np.where + zip per call) is skipped.
+        # Keyed on the exact board rather than the symmetry-canonical state key:
+        # symmetric variants share statistics but not action coordinates.
+        self._next_actions_cache: dict[bytes, list] = {}
 
-    def perform_lookahead(self, root):
+    def perform_lookahead(self, root, path=None):
         '''
         This is the selection part of the tree search. Given a root node
         representing the current game state, carve out a path through the game
-        tree following the UCB1 heuristic.  
+        tree following the UCB1 heuristic. The path is recorded into `path`
+        (defaults to the agent's own), so concurrent workers can carve
+        independent paths.
+        '''
+        if path is None:
+            path = self.path
+        node = root
+        path.append(node)
+        # Descend iteratively until we are at a leaf node.
+        while not node.is_leaf():
+            most_promising_idx = int(np.argmax(self.compute_ucb_scores_(node)))
+            node = node.children_states[most_promising_idx]
+            path.append(node)
+
+    def compute_ucb_scores_(self, node: NaiveNode) -> np.ndarray:
+        '''
+        UCB1 scores for every child of `node` in one vectorized pass over the
+        parent's SoA stat views.
         '''
-         
-        self.path.append(root)
-        # Stop search if we are at a leaf node.
-        if (root.is_leaf()):
-            return
-        # For now we will use the UCB1 heuristic.
         C = self.exploration_constant
-        most_promising_node = None
-        best_value = 0
-        for child in root.children_states:
-            # We wish to involve the statistic relevant to the MCTS agent. 
-            if not child.is_opponent_turn:
-                exploitation_value = child.n_won / child.n_visited
-            else:
-                exploitation_value = 1 - (child.n_won / child.n_visited)
-            exploration_bonus = C * np.sqrt(np.log(root.n_visited) / child.n_visited)
-            if (exploitation_value + exploration_bonus) >= best_value:
-                best_value = exploitation_value + exploration_bonus
-                most_promising_node = child 
-        self.perform_lookahead(most_promising_node) 
+        w = node._n_won
+        # In-flight simulations count as extra visits (virtual loss) so that
+        # concurrent workers spread out instead of replaying the same path.
+        # Divide once, multiply everywhere else: both UCB1 terms share 1/n_visited.
+        inv_v = 1.0 / (node._n_visited + node._virtual_loss)
+        # We wish to involve the statistic relevant to the MCTS agent.
+        exploitation_values = np.where(node._is_opp, 1.0 - w * inv_v, w * inv_v)
+        exploration_bonuses = C * np.sqrt(node.log_visits() * inv_v)
+        ucb_scores = exploitation_values + exploration_bonuses
+        # Solved children are pruned from selection, not steered into: their
+        # values are proven, so further rollouts there teach nothing. The
+        # agent-perspective +/-inf scores only decide the final pick in
+        # make_move, where the agent is always the chooser.
+        return np.where(node._solved_score != 0.0, -np.inf, ucb_scores)
 
     def create_children_for_node(self, node: NaiveNode):
-        # get all possible next states
-        possible_next_states, input_actions = \
-        self.game_obj.get_next_game_states(self.mark)
-        node.add_children(possible_next_states, input_actions) 
+        # Enumerate only the legal actions; child states materialize lazily from
+        # the parent on first access instead of being copied out per move here.
+        board_key = self.game_obj.get_current_game_state().tobytes()
+        input_actions = self._next_actions_cache.get(board_key)
+        if input_actions is None:
+            input_actions = self.game_obj.get_all_next_actions()
+            # Keep the cache on a budget: at tic-tac-toe scale this never trips,
+            # but a bigger game shouldn't be able to grow it without bound.
+            if len(self._next_actions_cache) >= 4096:
+                self._next_actions_cache.clear()
+            self._next_actions_cache[board_key] = input_actions
+        # Hand the agent's memory down so expansion can link transposed states
+        # (same position via a different move order or symmetry) to their
+        # existing nodes instead of allocating duplicates.
+        node.add_children(input_actions, self.mark, memory=self.memory)
     
     def determine_playout_node(self, parent_node: NaiveNode) -> NaiveNode:
         # For now we will just pick uniformly among the children of the former leaf node.
-        return random.choice(list(parent_node.children_states))
+        # children_states is a list, so index directly rather than copying into a new one.
+        children = parent_node.children_states
+        return children[self.rng.randrange(len(children))]
     
     def perform_playout(self, playout_node: NaiveNode) -> Outcome:
-        simulated_game_obj = playout_node.game_obj.copy_()
+        # Hot path: random playouts on a tic-tac-toe board skip the generic
+        # Game/Policy machinery and run through the inlined rollout kernel.
+        if isinstance(playout_node.game_obj, TicTacToeBoard) and isinstance(self.playout_policy, RandomTTTPolicy):
+            flat_board = playout_node.game_obj.get_current_game_state().reshape(-1).tolist()
+            result = rollout(flat_board, playout_node.is_opponent_turn,
+                             to_indicator(self.mark), self.rng)
+            if result == 1:
+                return Outcome.WIN
+            elif result == -1:
+                return Outcome.LOSS
+            return Outcome.DRAW
+        # Recycle a pooled board when one is available rather than allocating.
+        # Pop-then-catch instead of check-then-pop: tree-parallel workers run
+        # playouts outside the lock, so a peeked entry can vanish before the
+        # pop. Games without reset_from (only TicTacToeBoard implements it)
+        # fall back to a fresh copy as well.
+        try:
+            simulated_game_obj = self.game_pool.pop()
+            simulated_game_obj.reset_from(playout_node.game_obj)
+        except (IndexError, NotImplementedError):
+            simulated_game_obj = playout_node.game_obj.copy_()
         simulated_opponent = Player(self.opponent_mark)
         is_opponent_turn = playout_node.is_opponent_turn
-        while self.game_obj.is_terminal_state(simulated_game_obj)[0] == False:
+        # Carry the (is_terminal, winner) tuple through the loop so each state is
+        # scanned exactly once and the winner is already in scope afterwards.
+        is_terminal, winner = self.game_obj.is_terminal_state(simulated_game_obj)
+        while not is_terminal:
             # simulate moves (for both MCTS and opponent) according to specified policy
             row, col = self.playout_policy.select_action(simulated_game_obj.board)
             if is_opponent_turn:
@@ -97,26 +185,108 @@ class NaiveMCTS(MCTSAgent):
             else:
                 simulated_game_obj.mark_move(self, row, col)
             is_opponent_turn = not is_opponent_turn
-        winner = simulated_game_obj.is_terminal_state(simulated_game_obj)[1]
+            is_terminal, winner = self.game_obj.is_terminal_state(simulated_game_obj)
+        self.game_pool.append(simulated_game_obj)
         if winner == self.mark:
             return Outcome.WIN
         elif winner == self.opponent_mark:
             return Outcome.LOSS
         return Outcome.DRAW
-    
-    def backpropagate_outcome(self, outcome: Outcome):
+
+    def perform_playouts(self, playout_node: NaiveNode, k: int):
+        '''
+        Leaf parallelization: run `k` independent playouts from the same playout node
+        and aggregate the outcomes, so the whole batch is backpropagated in one walk
+        of the path.
+        '''
+        n_wins = n_losses = n_draws = 0
+        if isinstance(playout_node.game_obj, TicTacToeBoard) and isinstance(self.playout_policy, RandomTTTPolicy):
+            # Pack the position into bitboards once; every rollout in the batch
+            # reshuffles the same empty-cell list and works on int copies.
+            flat_board = playout_node.game_obj.get_current_game_state().reshape(-1).tolist()
+            agent_indicator = to_indicator(self.mark)
+            agent_bitboard, opponent_bitboard, empty_cells = pack_board(flat_board, agent_indicator)
+            for _ in range(k):
+                result = rollout_from_bitboards(agent_bitboard, opponent_bitboard, empty_cells,
+                                                playout_node.is_opponent_turn, self.rng)
+                if result == 1:
+                    n_wins += 1
+                elif result == -1:
+                    n_losses += 1
+                else:
+                    n_draws += 1
+            return (n_wins, n_losses, n_draws)
+        for _ in range(k):
+            outcome = self.perform_playout(playout_node)
+            if outcome == Outcome.WIN:
+                n_wins += 1
+            elif outcome == Outcome.LOSS:
+                n_losses += 1
+            else:
+                n_draws += 1
+        return (n_wins, n_losses, n_draws)
+
+    def backpropagate_outcome(self, playout_counts):
         # for each node in the path from root to non-terminal leaf, update its stored statistics.
         for node in self.path:
-            node.update_stats(outcome)     
+            node.update_stats(*playout_counts)
     
+    def proven_outcome_counts_(self, winner):
+        # Translate a terminal winner into the (n_wins, n_losses, n_draws)
+        # shape backpropagation consumes, so a proven outcome can be credited
+        # like any playout batch.
+        if winner == to_indicator(self.mark):
+            return (1, 0, 0)
+        elif winner == to_indicator(self.opponent_mark):
+            return (0, 1, 0)
+        return (0, 0, 1)
+
+    def mark_solved_terminal_(self, leaf_node: NaiveNode, winner, path=None):
+        # A terminal leaf has a proven value; record it and promote proven results
+        # up the carved path (any winning choice solves the chooser's node, all
+        # choices lost solves it the other way).
+        if path is None:
+            path = self.path
+        if winner == to_indicator(self.mark):
+            leaf_node.set_solved(Outcome.WIN)
+        elif winner == to_indicator(self.opponent_mark):
+            leaf_node.set_solved(Outcome.LOSS)
+        else:
+            leaf_node.set_solved(Outcome.DRAW)
+        for node in reversed(path[:-1]):
+            if node.solved_value is not None:
+                break
+            children_solved = [child.solved_value for child in node.children_states]
+            if node.is_opponent_turn:
+                # The agent picks the next move here.
+                if Outcome.WIN in children_solved:
+                    node.set_solved(Outcome.WIN)
+                elif all(solved == Outcome.LOSS for solved in children_solved):
+                    node.set_solved(Outcome.LOSS)
+                else:
+                    break
+            else:
+                # The opponent picks the next move here.
+                if Outcome.LOSS in children_solved:
+                    node.set_solved(Outcome.LOSS)
+                elif all(solved == Outcome.WIN for solved in children_solved):
+                    node.set_solved(Outcome.WIN)
+                else:
+                    break
+
     def selection_(self) -> NaiveNode:
         self.perform_lookahead(self.root)
         # At this point, self.path should be populated with a carve-out of game tree.
         leaf_node = self.path[-1]
         # We will construct the next game state from the terminal game state
         # determine if root is terminal (game state is deciding)
-        is_terminal, _ = self.game_obj.is_terminal_state(leaf_node.game_obj)
+        is_terminal, winner = leaf_node.terminal_info()
         if is_terminal:
+            self.mark_solved_terminal_(leaf_node, winner)
+            # Credit the proven outcome as a normal visit: without it the
+            # statistics along this path never move and every subsequent
+            # step() replays the identical argmax descent as a no-op.
+            self.backpropagation_(self.proven_outcome_counts_(winner))
             return None
         else:
             self.expansion_(leaf_node)
@@ -129,22 +299,53 @@ class NaiveMCTS(MCTSAgent):
     def expansion_(self, leaf_node: NaiveNode):
         self.create_children_for_node(leaf_node)
     
-    def simulation_(self, playout_node: NaiveNode) -> Outcome:
-        outcome = self.perform_playout(playout_node)
-        return outcome
-    
-    def backpropagation_(self, outcome: Outcome):
-        self.backpropagate_outcome(outcome)
+    def simulation_(self, playout_node: NaiveNode):
+        playout_counts = self.perform_playouts(playout_node, self.n_playouts)
+        return playout_counts
+
+    def backpropagation_(self, playout_counts):
+        self.backpropagate_outcome(playout_counts)
     
+    def find_descendant_for_state_(self, root: NaiveNode, state_key: bytes, max_depth=2) -> NaiveNode:
+        '''
+        Breadth-first search (a couple of plies deep) of `root`'s subtree for a node whose
+        game state matches `state_key`. Used to keep the relevant subtree when the game
+        moves forward instead of rebuilding the new root from nothing.
+        '''
+        frontier = root.children_states
+        for _ in range(max_depth):
+            next_frontier = []
+            for child in frontier:
+                if child.game_obj.get_state_key() == state_key:
+                    return child
+                next_frontier.extend(child.children_states)
+            frontier = next_frontier
+        return None
+
     def pre_step_setup_(self):
         # Flush out old path to prepare for next iteration of step().
-        self.path = deque([])
-        # We begin planning by examining the current state of the game. 
-        stringified_current_game_state = np.array2string(self.game_obj.get_current_game_state())
-        self.root = self.memory.get(stringified_current_game_state, None)
+        # Reuse the list across steps rather than allocating a fresh container.
+        self.path.clear()
+        # We begin planning by examining the current state of the game. The game
+        # provides the memory key and may canonicalize symmetric states onto one key.
+        current_game_state_key = self.game_obj.get_state_key()
+        self.root = self.memory.get(current_game_state_key, None)
+        if self.root is None and self.last_root is not None:
+            # Try to reuse rollout work from the previous step(): if the game advanced
+            # into a state we already expanded under the old root, graft that subtree
+            # as the new root instead of starting from scratch. Its siblings are
+            # dropped along with the old root.
+            grafted_root = self.find_descendant_for_state_(self.last_root, current_game_state_key)
+            if grafted_root is not None:
+                grafted_root.parent = None
+                grafted_root.child_index = None
+                # Drop the back-references so the discarded tree can be collected.
+                grafted_root.parents = []
+                self.root = self.memory[current_game_state_key] = grafted_root
         if self.root is None:
-            self.root = self.memory[stringified_current_game_state] = \
-            NaiveNode(self.game_obj, None, is_opponent=True) 
+            self.root = self.memory[current_game_state_key] = \
+            NaiveNode(self.game_obj, None, is_opponent=True)
+        self.last_root = self.root
     
     def step(self):
         # Edge case: if current game state is already deciding, no point in planning.
@@ -154,27 +355,217 @@ class NaiveMCTS(MCTSAgent):
         playout_node = self.selection_()
         if playout_node is None:
             return
-        # Now we perform a playout from this playout node, backpropagating after playout completion.
-        outcome = self.simulation_(playout_node)
+        # Now we perform playouts from this playout node, backpropagating after playout completion.
+        playout_counts = self.simulation_(playout_node)
         # Update internal statistics of all nodes in carved out path.
-        self.backpropagation_(outcome)
-    
+        self.backpropagation_(playout_counts)
+
+    def perform_lookahead_batch(self, root: NaiveNode, psims: int):
+        '''
+        Carve out `psims` selection paths in one walk from the root. Walkers that
+        collide on the same node are fanned out across that node's top-scoring
+        children (one per walker) instead of all following the argmax.
+
+        Returns:
+        paths (list[list[NaiveNode]]): One root-to-leaf path per simulation.
+        '''
+        paths = [[root] for _ in range(psims)]
+        active_walkers = [] if root.is_leaf() else list(range(psims))
+        while active_walkers:
+            # Group the walkers by the node they currently occupy.
+            groups = {}
+            for walker in active_walkers:
+                node = paths[walker][-1]
+                groups.setdefault(id(node), (node, []))[1].append(walker)
+            active_walkers = []
+            for node, walkers in groups.values():
+                ucb_scores = self.compute_ucb_scores_(node)
+                n_top = min(len(walkers), len(node.children_states))
+                top_indices = np.argpartition(-ucb_scores, n_top - 1)[:n_top]
+                for rank, walker in enumerate(walkers):
+                    child = node.children_states[int(top_indices[rank % n_top])]
+                    paths[walker].append(child)
+                    if not child.is_leaf():
+                        active_walkers.append(walker)
+        return paths
+
+    def step_batch(self, psims=4):
+        """
+        Batched variant of step(): runs `psims` simulations per call with a single
+        grouped walk from the root (colliding walkers are spread over top-k children),
+        then one playout batch and one backpropagation per carved path.
+
+        Args:
+        psims (int): Number of simultaneous simulations.
+        """
+        # Edge case: if current game state is already deciding, no point in planning.
+        if self.game_obj.is_terminal_state(self.game_obj)[0]:
+            return
+        self.pre_step_setup_()
+        paths = self.perform_lookahead_batch(self.root, psims)
+        for path in paths:
+            leaf_node = path[-1]
+            is_terminal, winner = leaf_node.terminal_info()
+            if is_terminal:
+                self.mark_solved_terminal_(leaf_node, winner, path)
+                playout_counts = self.proven_outcome_counts_(winner)
+                for node in path:
+                    node.update_stats(*playout_counts)
+                continue
+            # An earlier path in this batch may already have expanded this leaf.
+            if leaf_node.is_leaf():
+                self.expansion_(leaf_node)
+            playout_node = self.determine_playout_node(leaf_node)
+            path.append(playout_node)
+            playout_counts = self.perform_playouts(playout_node, self.n_playouts)
+            for node in path:
+                node.update_stats(*playout_counts)
+
+    def apply_virtual_loss_(self, path):
+        # Pre-charge every node on the path with an in-flight visit.
+        for node in path:
+            node.virtual_loss += 1
+            for parent, slot in node.parents:
+                parent._virtual_loss[slot] = node.virtual_loss
+
+    def revert_virtual_loss_(self, path):
+        for node in path:
+            node.virtual_loss -= 1
+            for parent, slot in node.parents:
+                parent._virtual_loss[slot] = node.virtual_loss
+
+    def step_tree_parallel(self, n_threads=4, n_iters=100):
+        """
+        Tree-parallel search on a single shared tree using virtual loss: each worker
+        thread selects a path under a lock, pre-charges the path with a virtual visit
+        so other workers are steered elsewhere, runs its playout without the lock, and
+        then reverts the virtual loss and applies the real outcome. Uses less memory
+        than root parallelization since there is only one tree.
+
+        Args:
+        n_threads (int): Number of worker threads.
+        n_iters (int): Total iteration budget, split evenly across workers.
+        """
+        # Edge case: if current game state is already deciding, no point in planning.
+        if self.game_obj.is_terminal_state(self.game_obj)[0]:
+            return
+        self.pre_step_setup_()
+        tree_lock = threading.Lock()
+
+        def worker(n_worker_iters):
+            for _ in range(n_worker_iters):
+                with tree_lock:
+                    path = []
+                    self.perform_lookahead(self.root, path)
+                    leaf_node = path[-1]
+                    is_terminal, winner = leaf_node.terminal_info()
+                    if is_terminal:
+                        self.mark_solved_terminal_(leaf_node, winner, path)
+                        playout_counts = self.proven_outcome_counts_(winner)
+                        for node in path:
+                            node.update_stats(*playout_counts)
+                        continue
+                    self.expansion_(leaf_node)
+                    playout_node = self.determine_playout_node(leaf_node)
+                    path.append(playout_node)
+                    self.apply_virtual_loss_(path)
+                # The playout itself runs outside the lock.
+                playout_counts = self.perform_playouts(playout_node, self.n_playouts)
+                with tree_lock:
+                    self.revert_virtual_loss_(path)
+                    for node in path:
+                        node.update_stats(*playout_counts)
+
+        threads = [threading.Thread(target=worker, args=(n_iters // n_threads,)) for _ in range(n_threads)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    def step_parallel(self, n_workers=4, n_iters=100):
+        """
+        Root-parallel alternative to calling step() n_iters times: each worker process
+        grows a fully independent tree from the current game state with its own seed, and
+        the per-action root statistics are merged by summing n_won/n_visited. No locks
+        are needed since the trees never share nodes. make_move() consults the merged
+        statistics when they are present.
+
+        Args:
+        n_workers (int): Number of worker processes (ideally the core count).
+        n_iters (int): Total iteration budget, split evenly across workers.
+        """
+        # Edge case: if current game state is already deciding, no point in planning.
+        if self.game_obj.is_terminal_state(self.game_obj)[0]:
+            return
+        worker_args = [
+            (self.game_obj.copy_(), self.mark, self.opponent_mark, self.playout_policy,
+             self.exploration_constant, random.randrange(2 ** 32), n_iters // n_workers)
+            for _ in range(n_workers)
+        ]
+        merged = {}
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            for worker_stats in executor.map(root_parallel_search_, worker_args):
+                for action, (n_won, n_visited) in worker_stats.items():
+                    won_so_far, visited_so_far = merged.get(action, (0, 0))
+                    merged[action] = (won_so_far + n_won, visited_so_far + n_visited)
+        self.merged_child_stats = merged
+
+    def should_stop_search(self, remaining_iters: int) -> bool:
+        """
+        Signals that further search cannot change the chosen move: the most-visited
+        root child leads the runner-up by more than the remaining iteration budget.
+        Drivers can poll this in their step() loop to skip wasted rollouts in
+        positions that have already converged.
+
+        Args:
+        remaining_iters (int): How many step() calls are left in the budget.
+        """
+        # Re-rooting happens lazily inside step(): polled before the first
+        # step() of a deliberation, self.root still describes the previous
+        # move's position, and its visit margins say nothing about this one.
+        # (The constructor's placeholder root wraps a raw init-state array
+        # rather than a Game, so it is treated as stale too.)
+        root_game = self.root.game_obj
+        if not isinstance(root_game, Game) or \
+                root_game.get_state_key() != self.game_obj.get_state_key():
+            return False
+        visits = self.root._n_visited
+        if len(visits) < 2:
+            return False
+        runner_up, leader = np.partition(visits, -2)[-2:]
+        return (leader - runner_up) > remaining_iters
+
     def make_move(self):
-        # Perform a one-step lookahead and greedily choose the move to take.
-        max_value = 0
-        best_child = None
-        for child in self.root.children_states:
-            if (child.get_value() >= max_value):
-                max_value = child.get_value()
-                best_child = child
-        return best_child.input_action
+        # If a root-parallel search ran, its merged statistics supersede the local tree.
+        if self.merged_child_stats:
+            best_action = max(self.merged_child_stats,
+                              key=lambda a: self.merged_child_stats[a][1])
+            self.merged_child_stats = None
+            return np.array(best_action)
+        # Pick the robust child: the most-visited one. UCB funnels visits
+        # toward the best move as the budget grows, and the visit count is a
+        # steadier signal than the win ratio, which a lucky playout or two can
+        # spike on a barely-visited child. should_stop_search already measures
+        # convergence in these terms.
+        # Proven children trump the statistics (scores are +/-inf): take a
+        # solved win immediately, never take a solved loss.
+        solved = self.root._solved_score
+        values = np.where(solved != 0.0, solved, self.root._n_visited)
+        best_idx = int(np.argmax(values))
+        # Use the edge's recorded action: a transposition-linked child's own
+        # input_action belongs to its first parent and may be illegal here.
+        return self.root.child_actions[best_idx]
               
     def internal_print_game_tree_(self, root: NaiveNode):
-        if self.game_obj.is_terminal_state(root.game_obj)[0]:
-            return
-        print(root)
-        for child in root.children_states:
-            self.internal_print_game_tree_(child)
+        # Walk with an explicit stack: no Python frame per node and no danger of
+        # tripping the recursion limit on large game trees.
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            if node.terminal_info()[0]:
+                continue
+            print(node)
+            stack.extend(reversed(node.children_states))
         
     def print_game_tree(self):
         self.internal_print_game_tree_(self.root)    
@@ -1,36 +1,165 @@
+import math
+import numpy as np
+from typing import Optional
 from utils import Outcome
 from games.Game import Game
 from agents.MCTSNode import MCTSNode
 
 class NaiveNode(MCTSNode):
+    # game_obj is a property here (lazy materialization), so its storage lives
+    # in the _game_obj slot rather than the base class's game_obj slot.
+    __slots__ = ('_game_obj', '_expansion_mark', 'n_won', 'n_visited',
+                 'virtual_loss', 'solved_value', 'children_states', 'parent',
+                 'child_index', 'parents', '_n_won', '_n_visited', '_is_opp',
+                 '_virtual_loss', '_solved_score', '_terminal_info',
+                 '_log_visits_cache', '_log_visits_valid', 'child_actions')
+
     def __init__(self, game_state: Game, input_action = None, is_opponent=False):
         super().__init__(game_state, input_action, is_opponent)
+        # Mark to apply when this node's state is materialized lazily from its
+        # parent (children are created with game_state=None; see game_obj below).
+        self._expansion_mark = None
         self.n_won = 0
         self.n_visited = 1
-        self.children_states: set[NaiveNode] = set()
-
-    def add_child(self, game_obj, input_action, v_init=0):
-        new_child = NaiveNode(game_obj, input_action=input_action, is_opponent=(not self.is_opponent_turn))
-        self.children_states.add(new_child)
-    
-    def add_children(self, game_objs, input_actions):
-        for idx, child in enumerate(game_objs):
-            self.add_child(child, input_actions[idx]) 
-    
+        # Count of in-flight simulations through this node; discourages concurrent
+        # workers from all piling onto the same path (virtual loss).
+        self.virtual_loss = 0
+        # Proven game-theoretic value of this subtree (from the agent's
+        # perspective), or None while still undecided. Set once a terminal state
+        # is reached here or all relevant children are themselves solved.
+        self.solved_value: Optional[Outcome] = None
+        self.children_states: list[NaiveNode] = []
+        # Action taken from *this* node to reach each child. A node linked in
+        # through a transposition keeps the input_action of its first parent,
+        # which need not be a legal move here, so edges carry their own action.
+        self.child_actions: list = []
+        # Who our parent is and where we sit in its children arrays, so that stat
+        # updates can be mirrored into the parent's SoA views below. `parent` is
+        # the primary parent (the one our lazy state materializes from); with
+        # transposition sharing a node can be linked under several parents, so
+        # `parents` carries every (parent, slot) pair that must be kept in sync.
+        self.parent = None
+        self.child_index = None
+        self.parents: list[tuple['NaiveNode', int]] = []
+        # Structure-of-arrays views over the children's statistics. Keeping these
+        # contiguous (and in float32 - single precision is plenty for win/visit
+        # counts and halves the cache footprint) lets the selection step compute
+        # UCB1 for every child in one vectorized shot instead of paying a NumPy
+        # call per child.
+        self._n_won = np.empty(0, dtype=np.float32)
+        self._n_visited = np.empty(0, dtype=np.float32)
+        self._is_opp = np.empty(0, dtype=bool)
+        self._virtual_loss = np.empty(0, dtype=np.float32)
+        # Solved children seen from the agent's perspective: +inf for proven wins,
+        # -inf for proven losses, 0.0 while unsolved (proven draws also stay 0.0
+        # so they keep competing on their statistics).
+        self._solved_score = np.empty(0)
+        # Cached (is_terminal, winner) tuple of this node's state. A node's state
+        # never changes once seen, so the win-line scan only ever runs once here.
+        self._terminal_info = None
+        # Lazily computed log(n_visited), invalidated whenever n_visited changes.
+        # log is invariant across children during selection, so caching it saves
+        # a transcendental per edge in the hot loop.
+        self._log_visits_cache = 0.0
+        self._log_visits_valid = False
+
+    def terminal_info(self):
+        if self._terminal_info is None:
+            game_obj = self.game_obj
+            self._terminal_info = game_obj.is_terminal_state(game_obj)
+        return self._terminal_info
+
+    def log_visits(self) -> float:
+        if not self._log_visits_valid:
+            self._log_visits_cache = math.log(self.n_visited)
+            self._log_visits_valid = True
+        return self._log_visits_cache
+
+    @property
+    def game_obj(self) -> Game:
+        # Children are created without a state: expansion would otherwise copy
+        # the board once per legal move just to park most copies unused. The
+        # state is derived from the parent's state plus our action on first touch.
+        if self._game_obj is None:
+            self._game_obj = self.parent.game_obj.get_next_game_state(self.input_action, self._expansion_mark)
+        return self._game_obj
+
+    @game_obj.setter
+    def game_obj(self, game_obj: Game):
+        self._game_obj = game_obj
+
+    def add_child(self, input_action, mark, v_init=0, memory=None):
+        # Transposition table: if the child's state has been seen before (possibly
+        # through a different move order or a symmetric variant), link the known
+        # node instead of growing a duplicate subtree. The tree becomes a DAG and
+        # visits from every path into the state pool into one set of statistics.
+        # No cycle guard is needed for acyclic games (marks are only ever added).
+        state_key = None
+        if memory is not None:
+            state_key = self.game_obj.get_child_state_key(input_action, mark)
+        if state_key is not None and state_key in memory:
+            new_child = memory[state_key]
+        else:
+            new_child = NaiveNode(None, input_action=input_action, is_opponent=(not self.is_opponent_turn))
+            new_child._expansion_mark = mark
+            new_child.parent = self
+            new_child.child_index = len(self.children_states)
+            if state_key is not None:
+                memory[state_key] = new_child
+        new_child.parents.append((self, len(self.children_states)))
+        self.children_states.append(new_child)
+        self.child_actions.append(input_action)
+        n_children = len(self.children_states)
+        self._n_won = np.resize(self._n_won, n_children)
+        self._n_visited = np.resize(self._n_visited, n_children)
+        self._is_opp = np.resize(self._is_opp, n_children)
+        self._virtual_loss = np.resize(self._virtual_loss, n_children)
+        self._solved_score = np.resize(self._solved_score, n_children)
+        # Seed the new slot from the child's current stats (nonzero when a
+        # transposition hit linked an already-visited node).
+        self._n_won[-1] = new_child.n_won
+        self._n_visited[-1] = new_child.n_visited
+        self._is_opp[-1] = new_child.is_opponent_turn
+        self._virtual_loss[-1] = new_child.virtual_loss
+        if new_child.solved_value == Outcome.WIN:
+            self._solved_score[-1] = np.inf
+        elif new_child.solved_value == Outcome.LOSS:
+            self._solved_score[-1] = -np.inf
+        else:
+            self._solved_score[-1] = 0.0
+
+    def add_children(self, input_actions, mark, memory=None):
+        for input_action in input_actions:
+            self.add_child(input_action, mark, memory=memory)
+
     def get_value(self):
         return self.n_won / self.n_visited
-    
-    def update_stats(self, outcome: Outcome):
-        if outcome == outcome.WIN:
-            if not self.is_opponent_turn:
-                self.n_won += 1
-        elif outcome == outcome.LOSS:
-            if self.is_opponent_turn:
-                self.n_won += 1
+
+    def update_stats(self, n_wins: int, n_losses: int, n_draws: int):
+        # Aggregated form of the per-outcome update: wins count for the MCTS agent's
+        # nodes, losses count for the opponent's nodes, and draws are worth half to both.
+        if not self.is_opponent_turn:
+            self.n_won += n_wins + 0.5 * n_draws
         else:
-            self.n_won += 0.5
-        self.n_visited += 1    
-    
+            self.n_won += n_losses + 0.5 * n_draws
+        self.n_visited += n_wins + n_losses + n_draws
+        self._log_visits_valid = False
+        # Keep every parent's SoA stat views in sync with our scalar stats.
+        for parent, slot in self.parents:
+            parent._n_won[slot] = self.n_won
+            parent._n_visited[slot] = self.n_visited
+
+    def set_solved(self, outcome: Outcome):
+        self.solved_value = outcome
+        if outcome == Outcome.WIN:
+            solved_score = np.inf
+        elif outcome == Outcome.LOSS:
+            solved_score = -np.inf
+        else:
+            solved_score = 0.0
+        for parent, slot in self.parents:
+            parent._solved_score[slot] = solved_score
+
     def is_leaf(self):
         return len(self.children_states) == 0
 
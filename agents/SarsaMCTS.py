@@ -1,3 +1,4 @@
+import math
 import numpy as np
 from agents.SarsaNode import SarsaNode
 from games.Game import Game
@@ -5,6 +6,33 @@ from agents.MCTSAgent import MCTSAgent
 from policies.Policy import Policy
 from utils import get_normalized_value
 from typing import List, Tuple, Callable
+from concurrent.futures import ProcessPoolExecutor
+import random
+import threading
+
+def root_parallel_search_(worker_args):
+    """
+    Worker routine for root-parallel Sarsa-UCT. Builds an independent agent with
+    its own seed, runs its share of iterations, and hands back the root-child
+    value statistics. Must live at module level so it can be pickled into the
+    worker processes.
+    """
+    (game_obj, mark, opponent_mark, playout_policy, exploration_constant,
+     alpha, gamma, trace_decay, seed, n_iters) = worker_args
+    random.seed(seed)
+    # The policy arrives unpickled with the parent's RNG state; reseed its
+    # per-instance generator too or every worker would replay identical playouts.
+    if hasattr(playout_policy, 'rng'):
+        playout_policy.rng.seed(seed)
+    worker_agent = SarsaMCTS(game_obj, mark, opponent_mark, playout_policy,
+                             exploration_constant=exploration_constant,
+                             alpha=alpha, gamma=gamma, trace_decay=trace_decay)
+    for _ in range(n_iters):
+        worker_agent.step()
+    return {
+        action: (child.V * child.n_visited, child.n_visited)
+        for action, child in worker_agent.root.children_states.items()
+    }
 
 class SarsaMCTS(MCTSAgent):
     """
@@ -22,7 +50,7 @@ class SarsaMCTS(MCTSAgent):
 
     `ucb1_tree_policy_`: This method calculates the Upper Confidence Bound (UCB1) heuristic to guide the tree traversal and selects the next best action based on the exploration-exploitation trade-off.
     `generate_episode_`: This method generates an episode (trajectory) by following either the tree policy (if the state is memorized) or the playout policy (if the state is new). This approach allows the agent to benefit from both MCTS playouts and reward-seeking frameworks.
-    `expand_tree_`: This method expands the game tree based on the current trajectory, updating the memory with the new game state as a child of its predecessor state. It efficiently adapts the representation policy of the agent.
+    `generate_episode_` also expands the game tree as it walks: the first unmemorized state reached is added to the memory as a child of its predecessor, efficiently adapting the representation policy of the agent.
     `backup_td_errors_`: This method performs MCTS backpropagation using the TD learning approach, leveraging eligibility traces to average all possible n-step returns from a state. This method updates the values of all states participating in the trajectory and adjusts the best and worst returns for normalization.
     `step`: This public method performs one iteration of the SarsaMCTS search. It's equivalent to the agent thinking about its next move after an opponent's move. It handles the selection/simulation, expansion, and backpropagation phases.
     `make_move`: This public method returns the most promising move for the agent based on its search.
@@ -77,8 +105,11 @@ class SarsaMCTS(MCTSAgent):
         
         # Store the trajectory the MCTS agent takes in the game environment.
         # As this is also a SARSA agent, the trajectories take the namesake (s,a,r,s',a') form
-        # But, a' is omitted since it is never needed for value computation (TD backwards mechanism). 
-        self.episode: List[Tuple[Game, List[int], int, Game]] = []
+        # But, a' is omitted since it is never needed for value computation (TD backwards mechanism).
+        # Each state travels with its memory key so expansion and backup never rehash a board.
+        self.episode: List[Tuple[Game, int, Tuple[int, int], int, Game, int]] = []
+        # Merged root-child values from the most recent step_parallel() call.
+        self.merged_child_values = None
     
     def ucb1_tree_policy_(self, game_state: SarsaNode) -> np.ndarray:
         """
@@ -92,98 +123,142 @@ class SarsaMCTS(MCTSAgent):
         best_a (np.ndarray): The next best action, represented as a numpy array.
         """
         
-        best_a = None
-        best_ucb = -np.inf
-        # best_a is guaranteed to be non-null because ucb1_tree_policy would only be called on 
+        # best_a is guaranteed to be non-null because ucb1_tree_policy would only be called on
         # non-terminal states.
         actions = game_state.game_obj.get_all_next_actions()
-        for a_i in actions:
-            if game_state.children_states.get(a_i, None) is not None:
-               child = game_state.children_states[a_i]
-               # To avoid any numerical explosions/implosions that might mess with the heuristic, 
-               # and as a best practice, we normalize. 
-               exploit_value = get_normalized_value(child.V, self.worst_return, self.best_return)
-               # NOTE: Divide by zero runtime error is guaranteed to not occur because
-               # `child.n_visited` will be >= 1 by execution of this line (refer to `expand_tree_()`)
-               explore_bonus = self.exploration_constant \
-                   * np.sqrt(2 * np.log(game_state.n_visited) / np.log(child.n_visited))
-               ucb_value = exploit_value + explore_bonus
-            # This guarantees the agent sweeps across all possible actions first. 
-            else:
-               ucb_value = np.inf
-            if ucb_value >= best_ucb:
-                best_ucb = ucb_value
-                best_a = a_i
-        return best_a
-    def generate_episode_(self, root_node: SarsaNode):
+        # Untried actions score +inf, so the agent sweeps across all possible
+        # actions before trusting the statistics. Check for one first; only
+        # when every action has a child do we fall through to the arrays.
+        if len(game_state.child_actions) < len(actions):
+            children = game_state.children_states
+            for a_i in actions:
+                # Actions key the children dict, so normalize the generator's
+                # coordinate arrays to hashable int tuples.
+                a_i = (int(a_i[0]), int(a_i[1]))
+                if a_i not in children:
+                    return a_i
+        # All actions tried: score every child in one vectorized pass over the
+        # parent's mirror stat arrays instead of probing the dict per action.
+        # To avoid any numerical explosions/implosions that might mess with the heuristic,
+        # and as a best practice, we normalize the exploitation term.
+        exploit_values = get_normalized_value(game_state._child_V, self.worst_return, self.best_return)
+        # The parent's log visit count is invariant across children: compute it once
+        # with the stdlib (scalar np ufuncs pay full dispatch overhead per call).
+        log_parent_visits = 2 * math.log(max(game_state.n_visited, 1))
+        # NOTE: Divide by zero runtime error is guaranteed to not occur because
+        # every tried child has n_visited >= 1 (expansion registers a node
+        # before the very backup that gives it its first visit)
+        # A child can transiently sit at 0 visits between expansion and its
+        # first backup (concurrent workers observe this window); the resulting
+        # inf bonus is exactly the wanted sweep behavior, so just silence the
+        # divide warning.
+        with np.errstate(divide='ignore'):
+            explore_bonuses = self.exploration_constant \
+                * np.sqrt(log_parent_visits / game_state._child_N)
+        return game_state.child_actions[int(np.argmax(exploit_values + explore_bonuses))]
+    def generate_episode_(self, root_node: SarsaNode, episode=None, tree_lock=None):
         """
-        Internal function that generates a trajectory upon following either a playout policy or 
+        Internal function that generates a trajectory upon following either a playout policy or
         tree policy, the choice depending on whether the agent arrives at a memorized state or not.
-        This effectively endows the SarsaMCTS agent the benefit of playouts (MCTS feature) under a 
+        This effectively endows the SarsaMCTS agent the benefit of playouts (MCTS feature) under a
         reward-seeking framework (RL theory).
         For instance, Naive MCTS methods delay reward propagation until at terminal state.
 
         Args:
         root_node (`SarsaNode`): The tree node (s_0 in RL language) from which to simulate a trajectory.
-        
+        episode (list | None): Container to record the trajectory into; defaults to
+        the agent's own `self.episode`. Concurrent workers pass their own.
+        tree_lock (threading.Lock | None): When given, the lock is held while the
+        trajectory runs through memorized states and released for the playout
+        tail; each memorized state visited is pre-charged with a virtual visit
+        to steer other workers elsewhere.
+
         Side Effects:
-        `self.episode` is populated with the trajectory information by end of function execution.
-        
+        `episode` is populated with the trajectory information by end of function execution.
+        `self.memory` is updated to memorize one new game state per trajectory (the
+        representation policy), added as a child of its predecessor — expansion is
+        fused into this walk since the frontier is detected here anyway.
+
         Returns:
-        None
+        vloss_nodes (list[SarsaNode]): The nodes carrying a virtual visit that the
+        caller must revert before backup (empty when no lock was given).
         """
+        if episode is None:
+            episode = self.episode
+        vloss_nodes = []
+        expanded = False
         s = root_node.game_obj
+        # The root's key is already cached on its node; every successor is
+        # stringified exactly once here and the key rides along in the episode.
+        s_key = root_node.key
         is_opponent_turn = root_node.is_opponent_turn
-        while (not self.game_obj.is_terminal_state(s)[0]):
-            # This state is memorized, invoke MCTS tree policy
-            if self.memory.get(s, None) != None:
-                a = self.ucb1_tree_policy_(s) 
-            else: # This state is NOT memorized, invoke playout policy (also MCTS theory).
-                a = self.playout_policy.select_action(s.state) # playout phase
-            sp: Game = s.get_next_game_state(a, self.mark if is_opponent_turn else self.opponent_mark)
-            is_opponent_turn = not is_opponent_turn
-            # RL theory: instead of waiting for reward signal at termnial state, we get it as we go.
-            r = self.game_obj.get_reward(sp, self) 
-            # EDGE CASE: We append a "throw-away" transition so that root node is included in backup
-            # for its root-to-next-state transition contribution.
-            if len(self.episode) == 0:
-                self.episode.append((None, None, 0, s))
-            self.episode.append((s, a, r, sp)) # s a r s' a' (well, almost)
-            s = sp
-    
-    def expand_tree_(self):
-        """
-        Internal function that expands out the game tree based on the current trajectory
-        This effectively endows the SarsaMCTS agent an adaptive representation policy, where
-        the current policy is to only expand the tree once per trajectory. Note that this policy
-        is somewhat memory-efficient since nodes are added once per step (MCTS-specific advantage), 
-        but is sample-inefficient (RL-specific disadvantage).
-        
-        Args:
-        None
-        
-        Side Effects:
-        `self.memory` is updated to memorize a new game state (sp in RL theory, child node in MCTS theory). 
-        This game state is also added as a child of its respective predecessor state (s in RL theory,
-        parent node in MCTS theory).
-
-        Returns:
-        None
-        """
-        for (s, a, _, sp) in self.episode[1:]:
-            parent_node = self.memory.get(str(s), None)
-            # By this algorithm's construction, `s` is guaranteed have been memorized in game tree.
-            assert parent_node is not None
-            # Add this state as a child of its predecessor.
-            if a not in parent_node.children_states.keys():
-                init_v = self.V_init(sp)
-                parent_node.add_child(sp, init_v, a) 
-            # "Expanding" the tree by including it in the memory buffer.
-            if self.memory.get(str(sp), None) is None:
-                self.memory[str(sp)] = parent_node.children_states[a] 
-                return
+        # Hoist the per-ply attribute chases into locals, same treatment as the
+        # backup loop: each self.<attr>.<method> resolution costs two dict
+        # lookups per simulated move otherwise.
+        is_terminal_state = self.game_obj.is_terminal_state
+        get_reward = self.game_obj.get_reward
+        memory_get = self.memory.get
+        select_playout_action = self.playout_policy.select_action
+        mark = self.mark
+        opponent_mark = self.opponent_mark
+        in_tree = tree_lock is not None
+        if in_tree:
+            tree_lock.acquire()
+        try:
+            while (not is_terminal_state(s)[0]):
+                # This state is memorized, invoke MCTS tree policy. Once this
+                # trajectory has expanded its one node, the rest is playout
+                # regardless of what later states happen to be memorized.
+                node = memory_get(s_key, None) if not expanded else None
+                if node is not None:
+                    a = self.ucb1_tree_policy_(node)
+                    if in_tree:
+                        # Virtual loss: an in-flight visit dilutes this node's
+                        # exploration bonus for concurrent workers until reverted.
+                        node.n_visited += 1
+                        node.write_back_stats()
+                        vloss_nodes.append(node)
+                else: # This state is NOT memorized, invoke playout policy (also MCTS theory).
+                    if in_tree:
+                        # Left the memorized part of the tree; the playout tail
+                        # touches no shared state, so run it without the lock.
+                        tree_lock.release()
+                        in_tree = False
+                    a = select_playout_action(s.state) # playout phase
+                    a = (int(a[0]), int(a[1]))
+                sp: Game = s.get_next_game_state(a, mark if is_opponent_turn else opponent_mark)
+                is_opponent_turn = not is_opponent_turn
+                sp_key = sp.get_state_hash()
+                # RL theory: instead of waiting for reward signal at termnial state, we get it as we go.
+                r = get_reward(sp, self)
+                # Fused expansion: while still in the memorized prefix, make sure
+                # the edge to sp exists (linking an already-memorized node rather
+                # than allocating a duplicate with fresh statistics), and memorize
+                # the first unmemorized successor. This walk already knows where
+                # the frontier is, so no second pass over the episode is needed.
+                if node is not None:
+                    if a not in node.children_states:
+                        existing_node = memory_get(sp_key, None)
+                        if existing_node is not None:
+                            node.link_child(a, existing_node)
+                        else:
+                            node.add_child(sp, self.V_init(sp), a)
+                    if memory_get(sp_key, None) is None:
+                        self.memory[sp_key] = node.children_states[a]
+                        expanded = True
+                # EDGE CASE: We append a "throw-away" transition so that root node is included in backup
+                # for its root-to-next-state transition contribution.
+                if len(episode) == 0:
+                    episode.append((None, None, None, 0, s, s_key))
+                episode.append((s, s_key, a, r, sp, sp_key)) # s a r s' a' (well, almost)
+                s = sp
+                s_key = sp_key
+        finally:
+            if in_tree:
+                tree_lock.release()
+        return vloss_nodes
     
-    def backup_td_errors_(self):
+    def backup_td_errors_(self, episode=None):
         """
         Internal function that performs the MCTS backpropagation in a offline, TD fashion.
         Eligibility traces are leveraged to average out all possible n-step returns from a given state
@@ -204,36 +279,49 @@ class SarsaMCTS(MCTSAgent):
         Returns: 
         None 
         """
+        if episode is None:
+            episode = self.episode
         td_cum = 0
         v_next = 0
+        # Hoist the loop-invariant attribute chases into locals: this loop is
+        # pure float arithmetic plus dict probes, and each self.<attr> costs a
+        # dict lookup per iteration otherwise.
+        gamma = self.gamma
+        decay_factor = self.trace_decay * gamma
+        memory_get = self.memory.get
+        V_playout = self.V_playout
         # Process the episode backwards to implement accumulation of TD errors.
-        for (_,_,r,sp) in self.episode[::-1]:
-            stringified_game_state = str(sp)
-            if self.memory.get(stringified_game_state, None) is not None:
-                v_current = self.memory[stringified_game_state].V
+        # reversed() iterates the list in place; [::-1] would copy it per backup.
+        for (_, _, _, r, sp, sp_key) in reversed(episode):
+            # One probe per transition; the node (or its absence) is reused for
+            # both the value read and the conditional update below.
+            node = memory_get(sp_key, None)
+            if node is not None:
+                v_current = node.V
             else:
                 # Since our representation policy forbids multiple expansions per episode, we estimate.
                 # MCTS theory
-                v_current = self.V_playout(sp)
-                
+                v_current = V_playout(sp)
+
             # RL theory - single step TD target is r + self.gamma * v_next
-            single_step_td = r + self.gamma * v_next - v_current
+            single_step_td = r + gamma * v_next - v_current
 
-            # Eligibility Tracing 
+            # Eligibility Tracing
             # Diminish the accumulated TD and add single step TD, which will appear as 2,3,... -step
-            # returns to older and older states. 
-            td_cum = (self.trace_decay * self.gamma * td_cum) + single_step_td
+            # returns to older and older states.
+            td_cum = (decay_factor * td_cum) + single_step_td
             # conditional updating a consequence of representation policy.
-            if self.memory.get(stringified_game_state, None) is not None:
-                node = self.memory[stringified_game_state]
+            if node is not None:
                 n = node.n_visited = node.n_visited + 1
                 alpha = 1 / n
                 # If state is heavily explored, it should become less and less sensitive to updates.
                 node.V += alpha * td_cum
-                if node.V >= self.best_return:
-                    self.best_return = node.V
-                if node.V <= self.worst_return:
-                    self.worst_return = node.V - 1e-9 # additional term prevents divide by zero issue
+                node.write_back_stats()
+                # C-level min/max beat the bytecode compare-and-jump pairs; the
+                # degenerate best == worst case is handled inside the
+                # normalizer's clamped denominator, so no epsilon nudging here.
+                self.best_return = max(self.best_return, node.V)
+                self.worst_return = min(self.worst_return, node.V)
             v_next = v_current
    
    
@@ -244,18 +332,20 @@ class SarsaMCTS(MCTSAgent):
     def simulation_(self):
         return
     
+    # Expansion happens inline during selection: generate_episode_ registers the
+    # frontier state the moment it detects it, so there is no second pass.
     def expansion_(self):
-        self.expand_tree_()
+        return
         
     def backpropagation_(self):
         self.backup_td_errors_()
                 
     def pre_step_setup_(self):
-        stringified_current_game_state = str(self.game_obj)
-        self.root = self.memory.get(stringified_current_game_state, None)
+        current_game_state_key = self.game_obj.get_state_hash()
+        self.root = self.memory.get(current_game_state_key, None)
         if self.root is None:
-            self.root = self.memory[stringified_current_game_state] = \
-            SarsaNode(self.game_obj, v_init=0, input_action=None, is_opponent=True) 
+            self.root = self.memory[current_game_state_key] = \
+            SarsaNode(self.game_obj, v_init=0, input_action=None, is_opponent=True)
         # Flush out old episode trajectory.
         self.episode = []       
           
@@ -285,6 +375,76 @@ class SarsaMCTS(MCTSAgent):
         self.expansion_()
         self.backpropagation_()
     
+    def revert_virtual_loss_(self, vloss_nodes):
+        # Undo the in-flight visits charged during a locked descent.
+        for node in vloss_nodes:
+            node.n_visited -= 1
+            node.write_back_stats()
+
+    def step_tree_parallel(self, n_threads=4, n_iters=100):
+        """
+        Tree-parallel search on the single shared tree using virtual loss: each
+        worker thread runs the tree-policy part of its episode under a lock,
+        pre-charging every memorized state it visits with a virtual visit so
+        other workers are steered elsewhere, finishes the playout tail without
+        the lock, and then reverts the virtual visits and applies expansion and
+        the TD backup under the lock. Uses less memory than root
+        parallelization since there is only one tree.
+
+        Args:
+        n_threads (int): Number of worker threads.
+        n_iters (int): Total iteration budget, split evenly across workers.
+        """
+        # Edge case: if current game state is already deciding, no point in planning.
+        if self.game_obj.is_terminal_state(self.game_obj)[0]:
+            return
+        self.pre_step_setup_()
+        tree_lock = threading.Lock()
+
+        def worker(n_worker_iters):
+            for _ in range(n_worker_iters):
+                episode = []
+                vloss_nodes = self.generate_episode_(self.root, episode, tree_lock)
+                with tree_lock:
+                    self.revert_virtual_loss_(vloss_nodes)
+                    self.backup_td_errors_(episode)
+
+        threads = [threading.Thread(target=worker, args=(n_iters // n_threads,)) for _ in range(n_threads)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    def step_parallel(self, n_workers=4, n_iters=100):
+        """
+        Root-parallel alternative to calling step() n_iters times: each worker
+        process runs an independent Sarsa-UCT search from the current game state
+        with its own seed, and the per-action root values are merged as
+        visit-weighted averages (sum of V * n_visited over sum of n_visited).
+        No locks are needed since the trees never share nodes. make_move()
+        consults the merged values when they are present.
+
+        Args:
+        n_workers (int): Number of worker processes (ideally the core count).
+        n_iters (int): Total iteration budget, split evenly across workers.
+        """
+        # Edge case: if current game state is already deciding, no point in planning.
+        if self.game_obj.is_terminal_state(self.game_obj)[0]:
+            return
+        worker_args = [
+            (self.game_obj.copy_(), self.mark, self.opponent_mark, self.playout_policy,
+             self.exploration_constant, self.alpha, self.gamma, self.trace_decay,
+             random.randrange(2 ** 32), n_iters // n_workers)
+            for _ in range(n_workers)
+        ]
+        merged = {}
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            for worker_stats in executor.map(root_parallel_search_, worker_args):
+                for action, (weighted_v, n_visited) in worker_stats.items():
+                    v_so_far, visited_so_far = merged.get(action, (0.0, 0))
+                    merged[action] = (v_so_far + weighted_v, visited_so_far + n_visited)
+        self.merged_child_values = merged
+
     def make_move(self) -> np.ndarray:
         """
         Public function that causes the MCTS agent to pick what it thinks is the most promising move
@@ -296,15 +456,21 @@ class SarsaMCTS(MCTSAgent):
         Returns:
         action (np.ndarray): The best action to take.
         """
+        # If a root-parallel search ran, its merged values supersede the local tree.
+        if self.merged_child_values:
+            best_action = max(self.merged_child_values,
+                              key=lambda a: self.merged_child_values[a][0]
+                              / max(self.merged_child_values[a][1], 1))
+            self.merged_child_values = None
+            return np.array(best_action)
         # Perform a one-step lookahead and greedily choose the move to take.
-        max_value = -np.inf
-        best_child = None
-        for child in self.root.children_states.values():
-            if (child.V >= max_value):
-                max_value = child.V
-                best_child = child
-        action = best_child.input_action
-        return action
+        # The root's mirrored child-value array is kept current by every TD
+        # backup, so the scan over children collapses to one argmax. The edge's
+        # action (child_actions slot) is authoritative: a node linked through a
+        # transposition keeps the input_action of its first parent, which need
+        # not be legal from this root.
+        best_idx = int(np.argmax(self.root._child_V))
+        return np.array(self.root.child_actions[best_idx])
 
     def internal_print_game_tree_(self, root: SarsaNode):
         """
@@ -319,11 +485,15 @@ class SarsaMCTS(MCTSAgent):
         Returns:
         None
         """
-        if self.game_obj.is_terminal_state(root.game_obj)[0]:
-            return
-        print(root)
-        for child in root.children_states.values():
-            self.internal_print_game_tree_(child)
+        # Walk with an explicit stack: no Python frame per node and no danger of
+        # tripping the recursion limit on large game trees.
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            if self.game_obj.is_terminal_state(node.game_obj)[0]:
+                continue
+            print(node)
+            stack.extend(node.children_states.values())
         
     def print_game_tree(self):
         """
@@ -1,27 +1,76 @@
+import numpy as np
 from typing import Tuple
 from agents.MCTSNode import MCTSNode
 from games.Game import Game
 
 class SarsaNode(MCTSNode):
-    def __init__(self, 
-                 game_state: Game, 
-                 v_init: int = 0, 
-                 input_action = None, 
+    __slots__ = ('V', 'n_visited', 'children_states', '_key', 'child_actions',
+                 '_child_V', '_child_N', 'parents')
+
+    def __init__(self,
+                 game_state: Game,
+                 v_init: int = 0,
+                 input_action = None,
                  is_opponent=False
                  ) -> None:
         super().__init__(game_state, input_action, is_opponent)
         self.V = v_init
         self.n_visited = 0
         self.children_states: dict[Tuple[int, int]: SarsaNode] = dict()
+        self._key = None
+        # Structure-of-arrays mirror of the children's statistics, in slot
+        # order matching child_actions, so the tree policy can score every
+        # child in one vectorized pass instead of probing the dict per action.
+        self.child_actions: list[Tuple[int, int]] = []
+        self._child_V = np.empty(0)
+        self._child_N = np.empty(0)
+        # Every (parent, slot) pair referencing this node; value/visit updates
+        # are written through to each parent's mirror arrays.
+        self.parents: list[tuple['SarsaNode', int]] = []
+
+    @property
+    def key(self) -> int:
+        """
+        The state hash of the board this node represents, used as the agent's
+        memory key. Cached on first use: the state behind a node never changes,
+        so rehashing it on every memory access is pure waste.
+        """
+        if self._key is None:
+            self._key = self.game_obj.get_state_hash()
+        return self._key
+
+    def link_child(self, input_action, child: 'SarsaNode') -> None:
+        """
+        Registers `child` under `input_action`, growing the mirror stat arrays
+        by one slot. Used both for freshly created children and for memorized
+        nodes reached through another path.
+        """
+        self.children_states[input_action] = child
+        child.parents.append((self, len(self.child_actions)))
+        self.child_actions.append(input_action)
+        n_children = len(self.child_actions)
+        self._child_V = np.resize(self._child_V, n_children)
+        self._child_N = np.resize(self._child_N, n_children)
+        self._child_V[-1] = child.V
+        self._child_N[-1] = child.n_visited
+
+    def write_back_stats(self) -> None:
+        """
+        Mirrors this node's V / n_visited into every parent's stat arrays;
+        call after mutating them (the TD backup does).
+        """
+        for parent, slot in self.parents:
+            parent._child_V[slot] = self.V
+            parent._child_N[slot] = self.n_visited
 
     def add_child(self, game_obj, v_init, input_action) -> None:
         new_child = SarsaNode(game_obj, input_action=input_action, v_init=v_init, is_opponent=(not self.is_opponent_turn))
-        self.children_states[input_action] = new_child
-    
+        self.link_child(input_action, new_child)
+
     def add_children(self, game_objs, input_actions) -> None:
         for idx, child in enumerate(game_objs):
-            self.add_child(child, input_actions[idx]) 
-    
+            self.add_child(child, input_actions[idx])
+
     def is_leaf(self) -> bool:
         return len(self.children_states) == 0
 
@@ -8,7 +8,7 @@ These methods will be called by the MCTS agent (e.g. for the above example, the
 the next states during the expansion stage). 
 """
 import numpy as np
-from typing import Tuple, Union, List
+from typing import Hashable, Tuple, Union, List
 from games.Player import Player
 
 class Game:
@@ -23,6 +23,15 @@ class Game:
         Internal function that creates a deep copy of the game object instance.
         """
         raise NotImplementedError
+
+    def reset_from(self, game_obj: 'Game'):
+        """
+        Overwrites this instance's state in place with `game_obj`'s state.
+        The allocation-free counterpart of `copy_`, letting callers recycle
+        game objects (e.g. the MCTS agents' playout pool) instead of creating
+        a fresh one per rollout.
+        """
+        raise NotImplementedError
         
     @staticmethod
     def get_init_game_state():
@@ -101,3 +110,33 @@ class Game:
         """
         raise NotImplementedError
 
+    def get_state_key(self) -> Hashable:
+        """
+        Provides a hashable key identifying the current state, suitable for
+        memoization (e.g. the MCTS agents' memory of previously seen states).
+        Games with board symmetries may override this to canonicalize, so all
+        equivalent states share one key.
+        """
+        return self.get_current_game_state().tobytes()
+
+    def get_state_hash(self) -> int:
+        """
+        Provides a 64-bit-ish integer hash of the current state. Unlike
+        `get_state_key` this never canonicalizes: a node fetched under this
+        hash always matches the queried board exactly, which callers that read
+        actions off the node's board rely on. Integer dict keys also probe
+        faster than serialized-board strings.
+        """
+        return hash(self.get_current_game_state().tobytes())
+
+    def get_child_state_key(self, action, mark) -> Union[Hashable, None]:
+        """
+        Provides the state key of the successor state reached by taking `action`
+        with `mark` from the current state, without materializing that successor.
+        Games with incrementally maintained hashes should override this; the MCTS
+        agents use it to consult their transposition table during expansion.
+        Returns None if the successor's key cannot be determined cheaply (callers
+        then simply skip the table).
+        """
+        return None
+
@@ -9,7 +9,53 @@ X_MARK_INDICATOR = 1
 O_MARK_INDICATOR = 0
 NO_MARK_INDICATOR = -1
 GRID_ROWS = 3
-GRID_COLS = 3 
+GRID_COLS = 3
+
+# mark -> indicator as a dict: the hot transition paths translate marks on
+# every simulated move, and a dict probe beats a function call + compare.
+# Anything that is not 'X' maps to O, matching mark_to_indicator's else-branch.
+_MARK_TO_INDICATOR = {'X': X_MARK_INDICATOR, 'O': O_MARK_INDICATOR}
+
+# Interned successor boards for get_next_game_state, keyed by
+# (exact parent hash, flat cell, mark indicator). Bounded the blunt way:
+# cleared outright on overflow, which for tic-tac-toe effectively never fires.
+_TRANSITION_CACHE = {}
+_TRANSITION_CACHE_MAX_ENTRIES = 4096
+
+# The 8 winning lines of the flattened 3x3 grid: rows, columns, diagonals.
+WIN_LINES = (
+    (0, 1, 2), (3, 4, 5), (6, 7, 8),
+    (0, 3, 6), (1, 4, 7), (2, 5, 8),
+    (0, 4, 8), (2, 4, 6),
+)
+
+# The same lines as 9-bit masks (bit i <-> flat cell i), so a side's whole board
+# fits in one int and a win check is just (bitboard & mask) == mask.
+WIN_MASKS = tuple((1 << a) | (1 << b) | (1 << c) for a, b, c in WIN_LINES)
+
+# The 8 symmetries of the 3x3 grid (4 rotations and their mirror images),
+# expressed as permutations of the flattened cell indices.
+_index_grid = np.arange(GRID_ROWS * GRID_COLS).reshape(GRID_ROWS, GRID_COLS)
+SYMMETRY_PERMUTATIONS = tuple(
+    np.rot90(grid, k).reshape(-1)
+    for grid in (_index_grid, np.fliplr(_index_grid))
+    for k in range(4)
+)
+
+# Zobrist keys: a random 64-bit value per (cell, mark indicator) pair. One table
+# is derived per board symmetry, so a board can carry the Zobrist hash of each of
+# its 8 orientations and update all of them with one XOR apiece per placed mark.
+# The symmetry-canonical state key then falls out as min() over 8 ints instead of
+# re-permuting and serializing the board on every lookup.
+_zobrist_base = np.random.SeedSequence(0).generate_state(
+    GRID_ROWS * GRID_COLS * 2, dtype=np.uint64).reshape(GRID_ROWS * GRID_COLS, 2)
+SYMMETRY_ZOBRIST_KEYS = tuple(
+    tuple(
+        tuple(int(_zobrist_base[int(inverse_perm[cell]), mark]) for mark in range(2))
+        for cell in range(GRID_ROWS * GRID_COLS)
+    )
+    for inverse_perm in (np.argsort(perm) for perm in SYMMETRY_PERMUTATIONS)
+)
 
 class TicTacToeBoard(Game):
     """
@@ -34,20 +80,49 @@ class TicTacToeBoard(Game):
     """
     def __init__(self, configuration:Union[np.ndarray, None] = None):
         if configuration is None:
-            self.board = np.full((GRID_ROWS,GRID_COLS), NO_MARK_INDICATOR)
+            # int8 holds the three indicator values and cuts the board (and
+            # every copy of it) from 72 bytes to 9.
+            self.board = np.full((GRID_ROWS,GRID_COLS), NO_MARK_INDICATOR, dtype=np.int8)
         else:
             self.board = configuration
         super().__init__(self.board)
-    
+        self._sym_hashes = self.compute_symmetry_hashes_()
+        # Memoized pure-function-of-the-board results; invalidated by mark_move
+        # and reset_from, the only ways an existing board changes.
+        self._terminal_info = None
+        self._actions_cache = None
+
+    def compute_symmetry_hashes_(self):
+        """
+        Internal function that computes the Zobrist hash of every orientation of the
+        current board from scratch. Only needed at construction; mark_move keeps the
+        hashes up to date incrementally afterwards.
+        """
+        hashes = [0] * len(SYMMETRY_ZOBRIST_KEYS)
+        flat_board = self.board.reshape(-1)
+        for cell in range(flat_board.size):
+            mark = flat_board[cell]
+            if mark == NO_MARK_INDICATOR:
+                continue
+            for sym in range(len(hashes)):
+                hashes[sym] ^= SYMMETRY_ZOBRIST_KEYS[sym][cell][int(mark)]
+        return hashes
+
     def mark_move(self, player: Player, row, col):
         if not self.is_move_valid_(row, col):
             raise RuntimeError("Invalid row and/or column specified.")
-        translated_mark = TicTacToeBoard.mark_to_indicator(player.mark)
+        translated_mark = _MARK_TO_INDICATOR.get(player.mark, O_MARK_INDICATOR)
         self.board[row, col] = translated_mark
-        
-    @staticmethod 
+        # Fold the new mark into the per-orientation Zobrist hashes.
+        cell = row * GRID_COLS + col
+        for sym in range(len(self._sym_hashes)):
+            self._sym_hashes[sym] ^= SYMMETRY_ZOBRIST_KEYS[sym][cell][translated_mark]
+        self._terminal_info = None
+        self._actions_cache = None
+
+    @staticmethod
     def mark_to_indicator(mark) -> int:
-        return X_MARK_INDICATOR if mark == 'X' else O_MARK_INDICATOR
+        return _MARK_TO_INDICATOR.get(mark, O_MARK_INDICATOR)
     
     @staticmethod
     def indicator_to_mark(indicator) -> str:
@@ -59,7 +134,7 @@ class TicTacToeBoard(Game):
 
     @staticmethod
     def get_init_game_state() -> np.ndarray:
-        return np.full((GRID_ROWS,GRID_COLS), NO_MARK_INDICATOR)
+        return np.full((GRID_ROWS,GRID_COLS), NO_MARK_INDICATOR, dtype=np.int8)
 
     @staticmethod 
     def get_reward(game_obj: 'TicTacToeBoard', player: Player) -> int:
@@ -76,21 +151,75 @@ class TicTacToeBoard(Game):
         
     def copy_(self) -> Game:
         return TicTacToeBoard(self.board.copy())
+
+    def reset_from(self, game_obj: 'TicTacToeBoard'):
+        # In-place overwrite; self.state aliases self.board so both stay current.
+        self.board[:] = game_obj.board
+        self._sym_hashes = list(game_obj._sym_hashes)
+        self._terminal_info = None
+        self._actions_cache = None
     
     def get_current_game_state(self) -> np.ndarray:
         return self.board
-    
+
+    def get_state_key(self) -> int:
+        # Canonicalize under the board's 8 symmetries: the key is the smallest
+        # Zobrist hash among all orientations, so symmetric positions share
+        # memoized search statistics instead of being stored 8 times over. The
+        # hashes are maintained incrementally by mark_move, so no board traversal
+        # happens here.
+        return min(self._sym_hashes)
+
+    def get_state_hash(self) -> int:
+        # The identity orientation's Zobrist hash, maintained incrementally by
+        # mark_move. Deliberately not the symmetry-canonical key: the SarsaMCTS
+        # memory walks actions off memorized boards, so a hit must be the exact
+        # board, not a symmetric variant of it.
+        return self._sym_hashes[0]
+
+    def get_child_state_key(self, action, mark) -> Union[int, None]:
+        # One XOR per orientation on top of the maintained hashes yields the
+        # successor's canonical key without copying the board. Returns None for
+        # an occupied cell, where the XOR would not describe any real state.
+        row, col = action
+        if self.board[row, col] != NO_MARK_INDICATOR:
+            return None
+        translated_mark = _MARK_TO_INDICATOR.get(mark, O_MARK_INDICATOR)
+        cell = row * GRID_COLS + col
+        return min(
+            self._sym_hashes[sym] ^ SYMMETRY_ZOBRIST_KEYS[sym][cell][translated_mark]
+            for sym in range(len(self._sym_hashes))
+        )
+
     def is_move_valid_(self, row: int, col: int) -> bool:
         return self.board[row, col] == NO_MARK_INDICATOR
     
     def get_next_game_state(self, action: np.ndarray, mark: str):
         '''
         Returns the next game state (s') from the current state (s) after taking
-        `action`, and marked with `mark`
+        `action`, and marked with `mark`.
+
+        Successor boards are interned: the agents request the same (s, a) -> s'
+        transition across thousands of search iterations, and each construction
+        pays for a board copy plus Zobrist setup. Returned boards are shared, so
+        callers must treat them as read-only (the agents do; only the live game
+        board and the playout pool are ever mutated).
         '''
+        row, col = action
+        translated_mark = _MARK_TO_INDICATOR.get(mark, O_MARK_INDICATOR)
+        key = (self._sym_hashes[0], int(row) * GRID_COLS + int(col), translated_mark)
+        cached = _TRANSITION_CACHE.get(key)
+        if cached is not None:
+            return cached
         new_state = self.board.copy()
-        new_state[tuple(action)] = TicTacToeBoard.mark_to_indicator(mark)
-        return TicTacToeBoard(new_state)
+        # row/col are already unpacked above; indexing with them directly
+        # avoids re-wrapping the action in a tuple per call.
+        new_state[row, col] = translated_mark
+        child = TicTacToeBoard(new_state)
+        if len(_TRANSITION_CACHE) >= _TRANSITION_CACHE_MAX_ENTRIES:
+            _TRANSITION_CACHE.clear()
+        _TRANSITION_CACHE[key] = child
+        return child
     
     def get_next_game_states(self, mark: str) -> Tuple[List[Game], List[int]]:
         '''
@@ -104,54 +233,66 @@ class TicTacToeBoard(Game):
         return pos_next_states, input_actions
     
     def get_all_next_actions(self) -> List[List[int]]:
-        pos_indices = np.where(self.board == NO_MARK_INDICATOR)
-        coords = list(np.array(list(zip(pos_indices[0], pos_indices[1]))).reshape(-1, 2)) 
-        return coords
-     
-    @staticmethod
-    def is_terminal_state(game_obj: Game): 
-        for i in range(GRID_ROWS):
-            row_no_dups = np.unique(game_obj.state[i])
-            if NO_MARK_INDICATOR in row_no_dups:
-                continue
-            if len(row_no_dups) == 1:
-                return (True, row_no_dups[0])
+        if self._actions_cache is None:
+            # argwhere yields the (row, col) pairs directly; the old
+            # where + zip + reshape dance built the same array the long way.
+            self._actions_cache = list(np.argwhere(self.board == NO_MARK_INDICATOR))
+        return self._actions_cache
 
-        for i in range(GRID_COLS):
-            col_no_dups = np.unique(game_obj.state[:, i])
-            if NO_MARK_INDICATOR in col_no_dups:
-                continue
-            if len(col_no_dups) == 1:
-                return (True, col_no_dups[0])
+    @staticmethod
+    def is_terminal_state(game_obj: Game):
+        # Pure in the board, so the scan runs once per distinct board content;
+        # the agents probe terminality of the same states over and over.
+        if game_obj._terminal_info is None:
+            game_obj._terminal_info = TicTacToeBoard.compute_terminal_state_(game_obj)
+        return game_obj._terminal_info
 
-        unique_tl_br_diagonal = np.unique(game_obj.state.diagonal())
-        if len(unique_tl_br_diagonal) == 1 and NO_MARK_INDICATOR not in unique_tl_br_diagonal:
-            return (True, unique_tl_br_diagonal[0])
+    @staticmethod
+    def compute_terminal_state_(game_obj: Game):
+        # Pack each side's marks into a 9-bit bitboard in one pass; a completed
+        # line is then (bitboard & mask) == mask against the 8 precomputed
+        # WIN_MASKS, replacing the old np.unique scans over every row, column
+        # and diagonal.
+        x_bitboard = 0
+        o_bitboard = 0
+        n_marked = 0
+        for cell, indicator in enumerate(game_obj.state.reshape(-1).tolist()):
+            if indicator == X_MARK_INDICATOR:
+                x_bitboard |= 1 << cell
+                n_marked += 1
+            elif indicator == O_MARK_INDICATOR:
+                o_bitboard |= 1 << cell
+                n_marked += 1
 
-        unique_bl_tr_diagonal = np.unique(np.fliplr(game_obj.state).diagonal())
-        if len(unique_bl_tr_diagonal) == 1 and NO_MARK_INDICATOR not in unique_bl_tr_diagonal:
-            return (True, unique_bl_tr_diagonal[0])
+        for mask in WIN_MASKS:
+            if x_bitboard & mask == mask:
+                return (True, X_MARK_INDICATOR)
+            if o_bitboard & mask == mask:
+                return (True, O_MARK_INDICATOR)
 
-        # Check if the grid is completely marked up. Control only reaches here if no row/col is dominated by a single mark. 
-        if NO_MARK_INDICATOR not in game_obj.state.flatten():
+        # Check if the grid is completely marked up. Control only reaches here if no line is dominated by a single mark.
+        if n_marked == GRID_ROWS * GRID_COLS:
             return (True, -1)
 
         return (False, None)
 
+    @staticmethod
+    def stringify_grid_(grid) -> str:
+        # Renders the grid with plain string joins in np.array2string's layout.
+        # The old object-dtype cast + three boolean masks + array2string was by
+        # far the heaviest way to format 9 cells.
+        rows = [
+            "[" + " ".join("'%s'" % TicTacToeBoard.indicator_to_mark(v) for v in row) + "]"
+            for row in grid.tolist()
+        ]
+        return "[" + "\n ".join(rows) + "]"
+
     @staticmethod
     def pretty_print_grid(grid):
-        stringified_board = grid.copy().astype("object")
-        stringified_board[stringified_board == X_MARK_INDICATOR] = "X"
-        stringified_board[stringified_board == O_MARK_INDICATOR] = "O"
-        stringified_board[stringified_board == NO_MARK_INDICATOR] = "_" 
-        print(np.array2string(stringified_board))
-    
+        print(TicTacToeBoard.stringify_grid_(grid))
+
     def __str__(self) -> str:
-        stringified_board = self.board.copy().astype("object")
-        stringified_board[stringified_board == X_MARK_INDICATOR] = "X"
-        stringified_board[stringified_board == O_MARK_INDICATOR] = "O"
-        stringified_board[stringified_board == NO_MARK_INDICATOR] = "_"
-        return np.array2string(stringified_board)
+        return TicTacToeBoard.stringify_grid_(self.board)
     
 if __name__ == "__main__":
     board = TicTacToeBoard()
@@ -4,17 +4,26 @@ from policies.Policy import Policy
 
 class RandomTTTPolicy(Policy):
     """
-    This implements a random tic-tac-toe policy where given a state, 
+    This implements a random tic-tac-toe policy where given a state,
     the next move is chosen uniformly among the open spots in the game board.
+
+    Each policy instance draws from its own `random.Random` rather than the
+    module-wide generator, so concurrent searches do not contend on (or
+    interleave) shared RNG state, and a seed can be pinned per instance for
+    reproducible playouts.
     """
-    def __init__(self):
-        pass
+    def __init__(self, seed=None):
+        self.rng = random.Random(seed)
     def select_action(self, state: np.ndarray):
         # we pick a random coordinate based on what's available.
-        avail_rows, avail_cols = np.where(state == -1) 
-        avail_coords = list(zip(avail_rows, avail_cols))
-        coord = random.choice(avail_coords)
-        return coord
-        
+        # On a 9-cell board a plain list scan beats the NumPy route (np.where +
+        # zip + choice paid three dispatches and two allocations per call); one
+        # tolist() gives plain ints to compare against.
+        n_cols = state.shape[1]
+        cells = state.reshape(-1).tolist()
+        empty_cells = [cell for cell in range(len(cells)) if cells[cell] == -1]
+        cell = empty_cells[self.rng.randrange(len(empty_cells))]
+        return (cell // n_cols, cell % n_cols)
+
 def main():
     print("Hello world, I am a random policy")
@@ -2,6 +2,8 @@ from agents.NaiveMCTS import NaiveMCTS
 from games.tictactoe.TicTacToe import TicTacToeBoard
 from games.Player import Player
 from policies.RandomPolicy import RandomTTTPolicy
+from concurrent.futures import ProcessPoolExecutor
+import os
 
 NUM_ROWS = 3
 NUM_COLS = 3
@@ -33,7 +35,10 @@ def simulate(
             print(tictactoe_game)
         if TicTacToeBoard.is_terminal_state(tictactoe_game)[0]:
             break
-        for _ in range(n_tree_iters):
+        for i in range(n_tree_iters):
+            # Bail out early once the best move can no longer change.
+            if mcts_brain.should_stop_search(n_tree_iters - i):
+                break
             mcts_brain.step()
         mcts_action = mcts_brain.make_move()
         tictactoe_game.mark_move(mcts_player, mcts_action[0], mcts_action[1])
@@ -49,19 +54,33 @@ def simulate(
     _, winner = tictactoe_game.is_terminal_state(tictactoe_game)
     return winner
 
-def run_experiments(n_trials=100, verbose=False): 
+def run_single_trial_(trial_config):
+    # Module-level so worker processes can unpickle a reference to it.
+    return simulate(**trial_config)
+
+def run_experiments(n_trials=100, verbose=False, n_workers=None):
+    trial_config = dict(
+        manual_play=False,
+        mcts_mark="X",
+        opponent_mark="O",
+        n_tree_iters=10,
+        verbose=verbose,
+        exploration_constant=1
+    )
     n_mcts_wins = 0
     n_opponent_wins = 0
     n_draws = 0
-    for _ in range(n_trials):
-        winner = simulate(
-            manual_play=False,
-            mcts_mark="X",
-            opponent_mark="O",
-            n_tree_iters=10,            
-            verbose=verbose,
-            exploration_constant=1
-        )
+    # Trials are fully independent games, so they parallelize across worker
+    # processes with no coordination; verbose runs stay serial so the printed
+    # game transcripts do not interleave.
+    if n_workers is None:
+        n_workers = 1 if verbose else os.cpu_count()
+    if n_workers > 1:
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            winners = list(executor.map(run_single_trial_, [trial_config] * n_trials))
+    else:
+        winners = [run_single_trial_(trial_config) for _ in range(n_trials)]
+    for winner in winners:
         if winner == 1:
             n_mcts_wins += 1
         elif winner == 0:
@@ -69,8 +88,10 @@ def run_experiments(n_trials=100, verbose=False):
         else:
             n_draws += 1
 
-    print(f"NUM MCTS WINS: {n_mcts_wins}/{n_trials} = {n_mcts_wins * 100 / n_trials}%") 
+    print(f"NUM MCTS WINS: {n_mcts_wins}/{n_trials} = {n_mcts_wins * 100 / n_trials}%")
     print(f"NUM OPPONENT WINS: {n_opponent_wins}/{n_trials} = {n_opponent_wins * 100 / n_trials}%")
     print(f"NUM DRAWS: {n_draws}/{n_trials} = {n_draws * 100 / n_trials}%")
-run_experiments(n_trials=100, verbose=False)
-# simulate(manual_play=False, n_tree_iters=100, verbose=False)
\ No newline at end of file
+
+if __name__ == "__main__":
+    run_experiments(n_trials=100, verbose=False)
+    # simulate(manual_play=False, n_tree_iters=100, verbose=False)
\ No newline at end of file
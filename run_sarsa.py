@@ -2,7 +2,9 @@ from agents.SarsaMCTS import SarsaMCTS
 from games.tictactoe.TicTacToe import TicTacToeBoard
 from games.Player import Player
 from policies.RandomPolicy import RandomTTTPolicy
-import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+import math
+import os
 
 def simulate(
     manual_play=False, 
@@ -10,7 +12,7 @@ def simulate(
     opponent_mark="O",
     n_tree_iters=10000,
     verbose=False,
-    exploration_constant=1/np.sqrt(2)
+    exploration_constant=1/math.sqrt(2)
     ):
 
     tictactoe_game = TicTacToeBoard()
@@ -59,28 +61,42 @@ def simulate(
     _, winner = tictactoe_game.is_terminal_state(tictactoe_game)
     return winner
 
-def run_experiments(n_trials=10, verbose=False): 
+def run_single_trial_(trial_config):
+    # Module-level so worker processes can unpickle a reference to it.
+    return simulate(**trial_config)
+
+def run_experiments(n_trials=10, verbose=False, n_workers=None):
+    trial_config = dict(
+        manual_play=False,
+        mcts_mark="X",
+        opponent_mark="O",
+        n_tree_iters=10,
+        exploration_constant=1,
+        verbose=verbose,
+    )
     n_mcts_wins = 0
     n_opponent_wins = 0
     n_draws = 0
-    for _ in range(n_trials):
-        winner = simulate(
-            manual_play=False,
-            mcts_mark="X",
-            opponent_mark="O",
-            n_tree_iters=10,
-            exploration_constant=1,          
-            verbose=verbose,
-        )
+    # Trials are independent games, so they fan out across worker processes
+    # exactly as in run.py; verbose runs stay serial to keep transcripts whole.
+    if n_workers is None:
+        n_workers = 1 if verbose else os.cpu_count()
+    if n_workers > 1:
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            winners = list(executor.map(run_single_trial_, [trial_config] * n_trials))
+    else:
+        winners = [run_single_trial_(trial_config) for _ in range(n_trials)]
+    for winner in winners:
         if winner == 1:
             n_mcts_wins += 1
         elif winner == 0:
             n_opponent_wins += 1
         else:
             n_draws += 1
-    print(f"NUM MCTS WINS: {n_mcts_wins}/{n_trials} = {n_mcts_wins * 100 / n_trials}%") 
+    print(f"NUM MCTS WINS: {n_mcts_wins}/{n_trials} = {n_mcts_wins * 100 / n_trials}%")
     print(f"NUM OPPONENT WINS: {n_opponent_wins}/{n_trials} = {n_opponent_wins * 100 / n_trials}%")
     print(f"NUM DRAWS: {n_draws}/{n_trials} = {n_draws * 100 / n_trials}%")
 
-run_experiments(n_trials=100, verbose=False)
-# simulate(manual_play=True, n_tree_iters=1, verbose=True)
\ No newline at end of file
+if __name__ == "__main__":
+    run_experiments(n_trials=100, verbose=False)
+    # simulate(manual_play=True, n_tree_iters=1, verbose=True)
\ No newline at end of file
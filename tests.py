@@ -1,9 +1,11 @@
+import math
+import os
 import numpy as np
 from agents.NaiveMCTS import NaiveMCTS
 from games.tictactoe.TicTacToe import TicTacToeBoard
 from games.Player import Player
 from policies.RandomPolicy import RandomTTTPolicy
-import matplotlib.pyplot as plt
+from concurrent.futures import ProcessPoolExecutor
 
 MCTS_INDICATOR = 1
 OPP_INDICATOR = 0
@@ -15,7 +17,7 @@ def simulate(
     opponent_indicator=0,
     n_tree_iters=10000,
     verbose=False,
-    exploration_constant=1/np.sqrt(2)
+    exploration_constant=1/math.sqrt(2)
     ):
 
     tictactoe_game = TicTacToeBoard()
@@ -51,35 +53,46 @@ def simulate(
 
     _, winner = tictactoe_game.is_terminal_state(tictactoe_game)
     return winner
+def run_single_trial_(trial_config):
+    # Module-level so worker processes can unpickle a reference to it.
+    return simulate(**trial_config)
+
 def run_experiments(
-    n_trials=N_TRIALS, 
-    verbose=False, 
-    exploration_constant=1, 
-    n_tree_iters=10000
-    ): 
+    n_trials=N_TRIALS,
+    verbose=False,
+    exploration_constant=1,
+    n_tree_iters=10000,
+    n_workers=None
+    ):
+    trial_config = dict(
+        manual_play=False,
+        mcts_indicator=1,
+        opponent_indicator=0,
+        n_tree_iters=n_tree_iters,
+        verbose=verbose,
+        exploration_constant=exploration_constant
+    )
+    # Independent games fan out across worker processes, mirroring run.py;
+    # verbose runs stay serial so the printed transcripts do not interleave.
+    if n_workers is None:
+        n_workers = 1 if verbose else os.cpu_count()
+    if n_workers > 1:
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            winners = list(executor.map(run_single_trial_, [trial_config] * n_trials))
+    else:
+        winners = [run_single_trial_(trial_config) for _ in range(n_trials)]
     n_mcts_wins = 0
-    n_opponent_wins = 0
-    n_draws = 0
-    for _ in range(n_trials):
-        winner = simulate(
-            manual_play=False,
-            mcts_indicator=1,
-            opponent_indicator=0,
-            n_tree_iters=n_tree_iters,            
-            verbose=verbose,
-            exploration_constant=exploration_constant
-        )
+    for winner in winners:
         if winner == 1:
             n_mcts_wins += 1
-        elif winner == 0:
-            n_opponent_wins += 1
-        else:
-            n_draws += 1
     return n_mcts_wins
 
 
 
 def vary_num_tree_iterations(n_max_tree_iters):
+    # Imported here so that importing this module (e.g. for run_experiments)
+    # does not pay matplotlib's startup cost; only the plotting sweep needs it.
+    import matplotlib.pyplot as plt
     # This determines how granular we want our findings of optimal tree iterations to be.
     n_checkpoints = 10
     n_iterations_set = np.linspace(1, n_max_tree_iters, n_checkpoints, dtype=int)
@@ -11,5 +11,6 @@ def print_game_object(game: Game):
 
 # Normalizer that places input value somewhere in [0,1]
 def get_normalized_value(input_value, min_value, max_value):
-    assert max_value != min_value
-    return (input_value - min_value) / (max_value - min_value)
\ No newline at end of file
+    # Branchless guard on the denominator: a degenerate range maps everything
+    # to 0 rather than dividing by zero.
+    return (input_value - min_value) / max(max_value - min_value, 1e-9)
\ No newline at end of file